@@ -2,17 +2,24 @@
 # Run with: python cleanup_windows.py [--yes|--no] [--dry-run] ...
 import os
 import sys
+import stat
 import shutil
 import subprocess
 import tempfile
 import ctypes
 import time
 import argparse
+import atexit
+import asyncio
 from pathlib import Path
 import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, NamedTuple
 import json
 import fnmatch
-from datetime import datetime, timedelta
+import functools
+import re
 
 # Lightweight color/emoji UI helpers
 try:
@@ -22,6 +29,26 @@ try:
 except Exception:
     pass
 
+try:
+    # Optional: linear-time (DFA) matching for large --exclude sets
+    import re2 as _re2  # type: ignore
+except Exception:
+    _re2 = None
+
+try:
+    # Optional: faster serialization of the --json report
+    import orjson as _orjson  # type: ignore
+except Exception:
+    _orjson = None
+
+try:
+    # Optional: IFileOperation for batched Recycle Bin deletes (--to-recycle)
+    import pythoncom as _pythoncom  # type: ignore
+    from win32com.shell import shell as _shell, shellcon as _shellcon  # type: ignore
+except Exception:
+    _pythoncom = None
+    _shell = _shellcon = None
+
 # Set UTF-8 encoding for stdout/stderr to handle Unicode characters
 if os.name == "nt":  # Windows
     try:
@@ -41,6 +68,158 @@ if os.name == "nt":  # Windows
         except Exception:
             pass
 
+# Win32 entry points, bound once with explicit prototypes: calls skip the windll
+# attribute lookups, and pointer-sized arguments are not truncated on 64-bit.
+_kernel32 = None
+_shell32 = None
+_user32 = None
+_MoveFileExW = None
+_ShellExecuteExW = None
+_SHELLEXECUTEINFOW = None
+_WaitForSingleObject = None
+_SHEmptyRecycleBinW = None
+_IsUserAnAdmin = None
+_MessageBoxW = None
+_CreateToolhelp32Snapshot = None
+_Process32FirstW = None
+_Process32NextW = None
+_OpenProcess = None
+_TerminateProcess = None
+_CloseHandle = None
+_PROCESSENTRY32W = None
+_SHFileOperationW = None
+_SHFILEOPSTRUCTW = None
+_DeleteFileW = None
+_RemoveDirectoryW = None
+_SetFileAttributesW = None
+if os.name == "nt":
+    try:
+        from ctypes import wintypes
+
+        # windll resolves through a LibraryLoader on every attribute access; keep the DLLs
+        _kernel32 = ctypes.windll.kernel32
+        _shell32 = ctypes.windll.shell32
+        _user32 = ctypes.windll.user32
+
+        _MoveFileExW = _kernel32.MoveFileExW
+        _MoveFileExW.argtypes = [wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD]
+        _MoveFileExW.restype = wintypes.BOOL
+
+        class _SHELLEXECUTEINFOW(ctypes.Structure):
+            _fields_ = [
+                ("cbSize", wintypes.DWORD),
+                ("fMask", wintypes.ULONG),
+                ("hwnd", wintypes.HWND),
+                ("lpVerb", wintypes.LPCWSTR),
+                ("lpFile", wintypes.LPCWSTR),
+                ("lpParameters", wintypes.LPCWSTR),
+                ("lpDirectory", wintypes.LPCWSTR),
+                ("nShow", ctypes.c_int),
+                ("hInstApp", wintypes.HINSTANCE),
+                ("lpIDList", ctypes.c_void_p),
+                ("lpClass", wintypes.LPCWSTR),
+                ("hkeyClass", wintypes.HKEY),
+                ("dwHotKey", wintypes.DWORD),
+                ("hIconOrMonitor", wintypes.HANDLE),
+                ("hProcess", wintypes.HANDLE),
+            ]
+
+        # ShellExecuteExW (unlike ShellExecuteW) can hand back the process handle
+        _ShellExecuteExW = _shell32.ShellExecuteExW
+        _ShellExecuteExW.argtypes = [ctypes.POINTER(_SHELLEXECUTEINFOW)]
+        _ShellExecuteExW.restype = wintypes.BOOL
+
+        _WaitForSingleObject = _kernel32.WaitForSingleObject
+        _WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+        _WaitForSingleObject.restype = wintypes.DWORD
+
+        _SHEmptyRecycleBinW = _shell32.SHEmptyRecycleBinW
+        _SHEmptyRecycleBinW.argtypes = [wintypes.HWND, wintypes.LPCWSTR, wintypes.DWORD]
+        _SHEmptyRecycleBinW.restype = ctypes.c_long  # HRESULT
+
+        _IsUserAnAdmin = _shell32.IsUserAnAdmin
+        _IsUserAnAdmin.argtypes = []
+        _IsUserAnAdmin.restype = wintypes.BOOL
+
+        _MessageBoxW = _user32.MessageBoxW
+        _MessageBoxW.argtypes = [wintypes.HWND, wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.UINT]
+        _MessageBoxW.restype = ctypes.c_int
+
+        class _PROCESSENTRY32W(ctypes.Structure):
+            _fields_ = [
+                ("dwSize", wintypes.DWORD),
+                ("cntUsage", wintypes.DWORD),
+                ("th32ProcessID", wintypes.DWORD),
+                ("th32DefaultHeapID", ctypes.c_size_t),
+                ("th32ModuleID", wintypes.DWORD),
+                ("cntThreads", wintypes.DWORD),
+                ("th32ParentProcessID", wintypes.DWORD),
+                ("pcPriClassBase", wintypes.LONG),
+                ("dwFlags", wintypes.DWORD),
+                ("szExeFile", wintypes.WCHAR * wintypes.MAX_PATH),
+            ]
+
+        _CreateToolhelp32Snapshot = _kernel32.CreateToolhelp32Snapshot
+        _CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+        _CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+
+        _Process32FirstW = _kernel32.Process32FirstW
+        _Process32FirstW.argtypes = [wintypes.HANDLE, ctypes.POINTER(_PROCESSENTRY32W)]
+        _Process32FirstW.restype = wintypes.BOOL
+
+        _Process32NextW = _kernel32.Process32NextW
+        _Process32NextW.argtypes = [wintypes.HANDLE, ctypes.POINTER(_PROCESSENTRY32W)]
+        _Process32NextW.restype = wintypes.BOOL
+
+        _OpenProcess = _kernel32.OpenProcess
+        _OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+        _OpenProcess.restype = wintypes.HANDLE
+
+        _TerminateProcess = _kernel32.TerminateProcess
+        _TerminateProcess.argtypes = [wintypes.HANDLE, wintypes.UINT]
+        _TerminateProcess.restype = wintypes.BOOL
+
+        # The per-file delete calls come from a separate handle created with
+        # use_last_error, so ctypes.get_last_error() reports why a call failed
+        _kernel32_le = ctypes.WinDLL("kernel32", use_last_error=True)
+
+        _DeleteFileW = _kernel32_le.DeleteFileW
+        _DeleteFileW.argtypes = [wintypes.LPCWSTR]
+        _DeleteFileW.restype = wintypes.BOOL
+
+        _RemoveDirectoryW = _kernel32_le.RemoveDirectoryW
+        _RemoveDirectoryW.argtypes = [wintypes.LPCWSTR]
+        _RemoveDirectoryW.restype = wintypes.BOOL
+
+        _SetFileAttributesW = _kernel32_le.SetFileAttributesW
+        _SetFileAttributesW.argtypes = [wintypes.LPCWSTR, wintypes.DWORD]
+        _SetFileAttributesW.restype = wintypes.BOOL
+
+        _CloseHandle = _kernel32.CloseHandle
+        _CloseHandle.argtypes = [wintypes.HANDLE]
+        _CloseHandle.restype = wintypes.BOOL
+
+        class _SHFILEOPSTRUCTW(ctypes.Structure):
+            # shellapi.h packs this structure to 1 byte on 32-bit Windows
+            if ctypes.sizeof(ctypes.c_void_p) == 4:
+                _pack_ = 1
+            _fields_ = [
+                ("hwnd", wintypes.HWND),
+                ("wFunc", wintypes.UINT),
+                ("pFrom", ctypes.c_void_p),   # double-null-terminated list of paths
+                ("pTo", ctypes.c_void_p),
+                ("fFlags", wintypes.WORD),
+                ("fAnyOperationsAborted", wintypes.BOOL),
+                ("hNameMappings", ctypes.c_void_p),
+                ("lpszProgressTitle", wintypes.LPCWSTR),
+            ]
+
+        _SHFileOperationW = _shell32.SHFileOperationW
+        _SHFileOperationW.argtypes = [ctypes.POINTER(_SHFILEOPSTRUCTW)]
+        _SHFileOperationW.restype = ctypes.c_int
+    except Exception:
+        pass
+
 
 class _C:
     RESET = "\x1b[0m"
@@ -61,32 +240,78 @@ def c(text: str, *styles: str) -> str:
 
 
 class Spinner:
+    """Status line for one cleanup step.
+
+    There is no animation thread: the frame only moves when a root finishes
+    (Spinner.tick() or Spinner.note()), so nothing competes with the delete
+    workers for the console while they run.
+    """
+
+    _active: "Spinner | None" = None
+    _lock = threading.Lock()
+
     def __init__(self, message: str):
         self.message = message
-        self._stop = threading.Event()
-        self._thread: threading.Thread | None = None
+        self._animate = False
+        self._quiet = False
+        self._frame = 0
+        self._detail = ""
         self.frames = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
 
-    def _run(self):
-        i = 0
-        while not self._stop.is_set():
-            frame = self.frames[i % len(self.frames)]
-            print("\r" + c(f" {frame} ", _C.CYAN) + self.message + " " * 10, end="", flush=True)
-            time.sleep(0.08)
-            i += 1
+    def _draw(self):
+        frame = self.frames[self._frame % len(self.frames)]
+        self._frame += 1
+        detail = f" {self._detail}" if self._detail else ""
+        sys.stdout.write("\r" + c(f" {frame} ", _C.CYAN) + self.message + c(detail, _C.DIM) + " " * 10)
+        sys.stdout.flush()
+
+    @classmethod
+    def tick(cls, detail: str = "") -> None:
+        """Advance the active spinner one frame, showing ``detail`` (e.g. "3/10") after it."""
+        with cls._lock:
+            spinner = cls._active
+            if spinner is not None:
+                spinner._detail = detail
+                spinner._draw()
+
+    @classmethod
+    def note(cls, text: str) -> None:
+        """Print ``text`` (one or more lines) above the active spinner, then redraw it."""
+        with cls._lock:
+            spinner = cls._active
+            if spinner is None:
+                print(text)
+                return
+            sys.stdout.write("\r" + " " * 80 + "\r" + text + "\n")
+            spinner._draw()
 
     def __enter__(self):
+        self._quiet = CONFIG.get("verbosity", 1) == 0
+        if self._quiet:
+            return self
+        try:
+            self._animate = bool(sys.stdout and sys.stdout.isatty())
+        except Exception:
+            self._animate = False
+        if not self._animate:
+            # Piped or redirected: a plain line, no redraws
+            print(c("⏳ ", _C.YELLOW) + self.message)
+            return self
         print(c("⏳ ", _C.YELLOW) + self.message, end="", flush=True)
-        self._thread = threading.Thread(target=self._run, daemon=True)
-        self._thread.start()
+        with Spinner._lock:
+            Spinner._active = self
         return self
 
     def __exit__(self, exc_type, exc, tb):
-        self._stop.set()
-        if self._thread:
-            self._thread.join(timeout=0.2)
-        # Clear line and print done/failed
+        if self._quiet:
+            return
         status = c("✓ Done", _C.GREEN, _C.BOLD) if exc is None else c("✗ Failed", _C.RED, _C.BOLD)
+        if not self._animate:
+            print(status)
+            return
+        with Spinner._lock:
+            Spinner._active = None
+        # Clear line and print done/failed
         print("\r" + " " * 80, end="\r")
         print(f"{status}")
 
@@ -97,12 +322,16 @@ DEFAULT_OWNER_NAME = "Amlan"
 # Runtime config/state (set in main)
 CONFIG: dict = {
     "exclude_patterns": [],            # list[str]
+    "_exclude_re": None,               # re.Pattern | None, all exclude patterns, matched on the full path
+    "_exclude_name_re": None,          # re.Pattern | None, separator-free patterns, also matched on the name
     "older_than_days": None,           # int | None
     "verbosity": 1,                    # 0 quiet, 1 normal, 2 verbose
     "log_file": None,                  # Path | None
     "dry_run": False,                  # bool
     "confirm_each": False,             # bool: prompt before each action
     "assume_yes": None,                # True/False/None from --yes/--no
+    "threads": 8,                      # int: worker threads for delete_contents
+    "to_recycle": False,               # bool: send all users' temp items to the Recycle Bin
 }
 
 STATS: dict = {
@@ -113,17 +342,75 @@ STATS: dict = {
     "scheduled_on_reboot": 0,
     "skipped_by_exclude": 0,
     "skipped_by_age": 0,
+    "recycled": 0,
 }
+# safe_delete runs on delete_contents worker threads; guard the counters
+_STATS_LOCK = threading.Lock()
+# Set when a cleanup is interrupted (Ctrl+C); deletion loops on worker threads
+# check it and return early, since cancelling a task cannot stop a running thread
+_STOP = threading.Event()
+
+
+def _new_stats() -> dict:
+    # Private counters for one worker; merged into STATS once its root is done
+    return dict.fromkeys(STATS, 0)
+
+
+def _add_counts(into: dict, counts: dict) -> None:
+    for key, value in counts.items():
+        if value:
+            into[key] += value
+
+
+def _merge_stats(counts: dict | None) -> None:
+    if counts:
+        with _STATS_LOCK:
+            _add_counts(STATS, counts)
+
+
+def _bump(key: str, amount: int = 1, stats: dict | None = None) -> None:
+    # ``stats`` is a counter dict owned by the calling thread, so it needs no lock
+    if stats is not None:
+        stats[key] += amount
+        return
+    with _STATS_LOCK:
+        STATS[key] += amount
+
+
+# Local time, ISO 8601 to the second, for log lines and the JSON report
+_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+# The --log file stays open for the whole run instead of being reopened per line;
+# _log is called from the delete worker threads, hence the lock.
+_LOG_LOCK = threading.Lock()
+_LOG_FH = None
+
+
+def _close_log() -> None:
+    global _LOG_FH
+    with _LOG_LOCK:
+        if _LOG_FH is not None:
+            try:
+                _LOG_FH.close()
+            except Exception:
+                pass
+            _LOG_FH = None
+
+
+atexit.register(_close_log)
 
 
 def _log(message: str, level: int = 1) -> None:
+    global _LOG_FH
     if CONFIG.get("verbosity", 1) >= level:
         print(message)
     log_path: Path | None = CONFIG.get("log_file")
     if log_path:
         try:
-            with log_path.open("a", encoding="utf-8", errors="ignore") as f:
-                f.write(f"{datetime.now().isoformat()} \t {message}\n")
+            with _LOG_LOCK:
+                if _LOG_FH is None:
+                    _LOG_FH = log_path.open("a", encoding="utf-8", errors="ignore")
+                _LOG_FH.write(f"{time.strftime(_TIMESTAMP_FORMAT)} \t {message}\n")
         except Exception:
             pass
 
@@ -132,15 +419,25 @@ def is_windows() -> bool:
     return os.name == "nt"
 
 
+@functools.lru_cache(maxsize=1)
 def is_admin() -> bool:
+    # The token's elevation cannot change while the process runs
     try:
-        return bool(ctypes.windll.shell32.IsUserAnAdmin())
+        return bool(_IsUserAnAdmin())
     except Exception:
         return False
 
 
-def relaunch_as_admin(argv: list[str]) -> None:
-    # Relaunch the current python interpreter with elevated rights.
+SEE_MASK_NOCLOSEPROCESS = 0x00000040
+INFINITE = 0xFFFFFFFF
+
+
+def relaunch_as_admin(argv: list[str], wait: bool = False) -> bool:
+    """Relaunch the current python interpreter with elevated rights.
+
+    With ``wait=True`` this blocks until the elevated process has exited.
+    Returns False if UAC was declined or the launch failed.
+    """
     # Ensure we append an internal marker to avoid infinite relaunch loops.
     argv2 = list(argv)
     if "--_elevated" not in argv2:
@@ -148,7 +445,100 @@ def relaunch_as_admin(argv: list[str]) -> None:
     # First parameter must be the script path (resolved path to current executable script)
     script_path = str(Path(sys.argv[0]).resolve())
     params = " ".join([f'"{script_path}"'] + [f'"{arg}"' for arg in argv2])
-    ctypes.windll.shell32.ShellExecuteW(None, "runas", sys.executable, params, None, 1)
+    info = _SHELLEXECUTEINFOW()
+    info.cbSize = ctypes.sizeof(info)
+    info.fMask = SEE_MASK_NOCLOSEPROCESS
+    info.lpVerb = "runas"
+    info.lpFile = sys.executable
+    info.lpParameters = params
+    info.nShow = 1
+    if not _ShellExecuteExW(ctypes.byref(info)):
+        return False
+    if info.hProcess:
+        try:
+            if wait:
+                _WaitForSingleObject(info.hProcess, INFINITE)
+        finally:
+            _CloseHandle(info.hProcess)
+    return True
+
+
+# Groups whose cleanup needs Administrator rights; the batch helper cleans them
+# with the worker given in _TASKS
+ADMIN_GROUPS = frozenset({"users_temp", "service_temp", "windows_temp", "prefetch"})
+
+
+def _run_admin_batch(argv: list[str], jobs: list[tuple[str, Path]]) -> bool:
+    """Hand all queued admin-only cleanups to one elevated helper process and wait for it.
+
+    The jobs are written to a private temp file that the helper reads via
+    --_admin-batch, so UAC is shown once per run instead of once per group. The
+    helper writes its counters back to the same path; they are merged into
+    STATS here so the summary and --json report include them.
+    """
+    fd, tmp = tempfile.mkstemp(prefix="windows-care-", suffix=".json")
+    launched = False
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump([{"group": group, "path": str(p)} for group, p in jobs], f)
+        launched = relaunch_as_admin(list(argv) + ["--_admin-batch", tmp], wait=True)
+        if launched:
+            try:
+                with open(tmp, encoding="utf-8") as f:
+                    counts = json.load(f)
+                if isinstance(counts, dict):
+                    _merge_stats({k: v for k, v in counts.items() if k in STATS and isinstance(v, int)})
+            except Exception:
+                # Helper crashed or was closed before reporting
+                pass
+    except Exception:
+        pass
+    try:
+        os.remove(tmp)
+    except Exception:
+        pass
+    return launched
+
+
+def _handle_admin_batch(batch_file: Path) -> int:
+    """Run the jobs written by _run_admin_batch (elevated helper side)."""
+    try:
+        jobs = json.loads(batch_file.read_text(encoding="utf-8"))
+    finally:
+        try:
+            batch_file.unlink()
+        except Exception:
+            pass
+    # Only accept paths this process would pick for the same group itself, so an
+    # edited batch file cannot point the elevated helper at arbitrary folders
+    groups = get_grouped_paths()
+    allowed = {
+        (group, str(p).lower())
+        for group in ADMIN_GROUPS
+        for p in groups.get(group, [])
+    }
+    by_group: dict[str, list[Path]] = {}
+    for job in jobs:
+        group = job.get("group")
+        path = Path(job.get("path", ""))
+        if (group, str(path).lower()) not in allowed:
+            _log(c(f"  Ignored unexpected batch entry: {path}", _C.YELLOW), level=1)
+            continue
+        by_group.setdefault(group, []).append(path)
+    # Same worker and arguments as the unelevated run would use for each group
+    asyncio.run(_clean_all([
+        (by_group[task.key], task.worker, task.kwargs())
+        for task in _TASKS
+        if task.key in by_group
+    ]))
+    # Report back to the waiting parent. "x" refuses to follow anything that was
+    # put at the path after it was removed above.
+    try:
+        with open(batch_file, "x", encoding="utf-8") as f:
+            json.dump(STATS, f)
+    except Exception:
+        pass
+    return 0
 
 
 def print_header(owner_name: str):
@@ -172,40 +562,201 @@ def print_header(owner_name: str):
         print("-" * 48)
 
 
-def _on_rm_error(func, path, exc_info):
+def _remove_with_retry(func, path: str) -> bool:
+    """Remove a single file or empty directory, clearing read-only once on failure."""
     try:
-        os.chmod(path, 0o700)
         func(path)
+        return True
+    except FileNotFoundError:
+        return True
     except Exception:
-        # Give up on this path; continue best-effort
-        pass
+        try:
+            os.chmod(path, 0o700)
+            func(path)
+            return True
+        except Exception:
+            # Give up on this path; continue best-effort
+            return False
 
 
-def _should_exclude(path: Path) -> bool:
-    patterns: list[str] = CONFIG.get("exclude_patterns", []) or []
-    if not patterns:
+def _is_tree(st: os.stat_result) -> bool:
+    # Real directories only: symlinks and junctions are unlinked, never recursed into
+    if not stat.S_ISDIR(st.st_mode):
         return False
-    text = str(path)
+    return not (getattr(st, "st_file_attributes", 0) & stat.FILE_ATTRIBUTE_REPARSE_POINT)
+
+
+def _is_dir_link(st: os.stat_result) -> bool:
+    # Directory symlinks/junctions must be removed with RemoveDirectoryW, not DeleteFileW
+    return bool(getattr(st, "st_file_attributes", 0) & stat.FILE_ATTRIBUTE_DIRECTORY)
+
+
+_FILE_ATTRIBUTE_NORMAL = 0x80
+ERROR_FILE_NOT_FOUND = 2
+ERROR_PATH_NOT_FOUND = 3
+ERROR_ACCESS_DENIED = 5
+
+
+def _remove_path(path: str, is_dir: bool = False) -> bool:
+    """Remove one file, link or empty directory, clearing read-only once on failure.
+
+    On Windows this calls DeleteFileW/RemoveDirectoryW directly and decides from
+    GetLastError: a missing path counts as removed, access denied (read-only) is
+    retried once after SetFileAttributesW, anything else (sharing violation,
+    non-empty directory) fails straight away.
+    """
+    if _DeleteFileW is None:
+        return _remove_with_retry(os.rmdir if is_dir else os.unlink, path)
+    func = _RemoveDirectoryW if is_dir else _DeleteFileW
+    if func(path):
+        return True
+    err = ctypes.get_last_error()
+    if err == ERROR_ACCESS_DENIED:
+        _SetFileAttributesW(path, _FILE_ATTRIBUTE_NORMAL)
+        if func(path):
+            return True
+        err = ctypes.get_last_error()
+    return err in (ERROR_FILE_NOT_FOUND, ERROR_PATH_NOT_FOUND)
+
+
+def _fast_rmtree(root: str) -> tuple[int, bool]:
+    """Remove a directory tree, returning the bytes freed and whether ``root`` is gone.
+
+    Files are deleted while the tree is scanned, with sizes taken from the same
+    DirEntry, so the tree is walked only once. Directories are collected in
+    discovery order and removed in a second, bottom-up pass. Falls back to
+    shutil.rmtree if anything unexpected goes wrong.
+    """
+    freed = 0
+    try:
+        dirs = [root]
+        i = 0
+        while i < len(dirs) and not _STOP.is_set():
+            current = dirs[i]
+            i += 1
+            try:
+                with os.scandir(current) as it:
+                    entries = list(it)
+            except Exception:
+                continue
+            for entry in entries:
+                if _STOP.is_set():
+                    break
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                except Exception:
+                    continue
+                if _is_tree(st):
+                    dirs.append(entry.path)
+                elif _remove_path(entry.path, _is_dir_link(st)):
+                    freed += st.st_size
+        # Children always follow their parent in dirs, so reversed order is bottom-up
+        removed = False
+        for d in reversed(dirs):
+            if _STOP.is_set():
+                return freed, False
+            removed = _remove_path(d, is_dir=True)
+        return freed, removed
+    except Exception:
+        shutil.rmtree(root, ignore_errors=True)
+        return freed, not os.path.lexists(root)
+
+
+_RE2_SPECIAL = frozenset("\\.^$|?*+()[]{}")
+
+
+def _glob_to_re2(pat: str) -> str:
+    # fnmatch.translate emits lookaheads/atomic groups that RE2 rejects; with a
+    # linear-time engine a plain ".*" per star is enough.
+    out: list[str] = []
+    i, n = 0, len(pat)
+    while i < n:
+        ch = pat[i]
+        i += 1
+        if ch == "*":
+            out.append(".*")
+        elif ch == "?":
+            out.append(".")
+        elif ch == "[":
+            j = i
+            if j < n and pat[j] == "!":
+                j += 1
+            if j < n and pat[j] == "]":
+                j += 1
+            while j < n and pat[j] != "]":
+                j += 1
+            if j >= n:
+                out.append("\\[")
+                continue
+            stuff = pat[i:j].replace("\\", "\\\\")
+            i = j + 1
+            if stuff.startswith("!"):
+                stuff = "^" + stuff[1:]
+            elif stuff.startswith("^"):
+                stuff = "\\" + stuff
+            out.append(f"[{stuff}]")
+        elif ch in _RE2_SPECIAL:
+            out.append("\\" + ch)
+        else:
+            out.append(ch)
+    return "(?s:" + "".join(out) + ")\\z"
+
+
+def _compile_excludes(patterns: list[str]) -> "re.Pattern | None":
+    """Combine glob patterns into one regex so each path is matched once, not once per pattern.
+
+    Uses Google's re2 binding when it is installed, otherwise the standard re module.
+    """
+    if patterns and _re2 is not None:
+        try:
+            combined = "|".join(f"(?:{_glob_to_re2(os.path.normcase(pat))})" for pat in patterns)
+            return _re2.compile(("(?i)" if is_windows() else "") + combined)
+        except Exception:
+            # fall back to the standard re module below
+            pass
+    parts: list[str] = []
     for pat in patterns:
         try:
-            if fnmatch.fnmatch(text, pat):
-                return True
+            # normcase lowercases and uses backslashes on Windows, like fnmatch.fnmatch
+            parts.append(f"(?:{fnmatch.translate(os.path.normcase(pat))})")
         except Exception:
             # ignore bad patterns
             continue
-    return False
+    if not parts:
+        return None
+    return re.compile("|".join(parts), re.IGNORECASE if is_windows() else 0)
+
+
+def _name_patterns(patterns: list[str]) -> list[str]:
+    """Return the patterns without a path separator (e.g. ``*.log``, ``desktop.ini``).
+
+    These are also tried against the entry name, on top of the full-path match
+    every pattern gets, so a plain file name pattern works as users expect.
+    """
+    return [pat for pat in patterns if "\\" not in pat and "/" not in pat]
+
 
+def _should_exclude(path: str | Path) -> bool:
+    name_re = CONFIG.get("_exclude_name_re")
+    path_re = CONFIG.get("_exclude_re")
+    path = os.fspath(path)
+    # match(), not search(): the translated globs are only anchored at the end
+    if name_re is not None and name_re.match(os.path.basename(path)) is not None:
+        return True
+    return path_re is not None and path_re.match(path) is not None
 
-def _passes_age_filter(path: Path) -> bool:
+
+def _passes_age_filter(path: str | Path, st: os.stat_result | None = None) -> bool:
     days: int | None = CONFIG.get("older_than_days")
     if not days or days <= 0:
         return True
     try:
         threshold = time.time() - (days * 86400)
-        stat = path.stat()
-        mtime = stat.st_mtime
-        ctime = getattr(stat, "st_ctime", mtime)
-        atime = getattr(stat, "st_atime", mtime)
+        if st is None:
+            st = os.stat(path)
+        mtime = st.st_mtime
+        ctime = getattr(st, "st_ctime", mtime)
+        atime = getattr(st, "st_atime", mtime)
         newest = max(mtime, ctime, atime)
         return newest < threshold
     except Exception:
@@ -213,131 +764,472 @@ def _passes_age_filter(path: Path) -> bool:
         return False
 
 
-def _path_size_bytes(path: Path) -> int:
+def _excluded(path: str, stats: dict | None = None) -> bool:
+    # For paths that are known to exist (listed by scandir): excludes only look at
+    # the path, so they are checked and counted before paying for an lstat
+    if _should_exclude(path):
+        _bump("skipped_by_exclude", stats=stats)
+        return True
+    return False
+
+
+def _admit(
+    path: str, st: os.stat_result, dry_run: bool, stats: dict | None = None
+) -> bool | None:
+    """Apply the age, confirmation and dry-run checks before a delete.
+
+    Excludes are checked by the caller, before the lstat that produced ``st``.
+    Returns True to go ahead, None if the path was deliberately skipped (which
+    counts as success) and False if it must be left alone and reported as not
+    deleted (dry-run, failed prompt).
+    """
+    if not _passes_age_filter(path, st):
+        _bump("skipped_by_age", stats=stats)
+        return None
+    # Optional per-action confirmation
     try:
-        if not path.exists():
-            return 0
-        if path.is_file():
-            return path.stat().st_size
-        total = 0
-        for root, dirs, files in os.walk(path, topdown=True):
-            for name in files:
-                fp = Path(root) / name
-                try:
-                    total += fp.stat().st_size
-                except Exception:
-                    continue
-        return total
+        if not _maybe_confirm(f"Delete {'directory' if _is_tree(st) else 'file'}: {path}?", default_no=False):
+            _log(c(f"Skipped by user: {path}", _C.DIM), level=2)
+            return None
     except Exception:
-        return 0
+        # If confirmation fails, do not proceed
+        return False
+    if dry_run:
+        _log(f"DRY-RUN would remove: {path}", level=2)
+        return False
+    return True
+
 
+def _unlink_counted(path: str, st: os.stat_result, stats: dict | None = None) -> bool:
+    # Remove a single non-directory entry and count it; raises if it is still there
+    if not _remove_path(path, _is_dir_link(st)):
+        raise OSError(f"Could not remove {path}")
+    _bump("files_deleted", stats=stats)
+    _bump("bytes_deleted", st.st_size, stats=stats)
+    return True
+
+
+def _give_up(path: str, stats: dict | None = None) -> None:
+    # Schedule deletion on reboot as a last resort
+    try:
+        schedule_delete_on_reboot(path)
+        _bump("scheduled_on_reboot", stats=stats)
+    except Exception:
+        pass
+    _bump("locked_or_failed", stats=stats)
 
-def safe_delete(path: Path, dry_run: bool = False) -> bool:
+
+def safe_delete(
+    path: str | Path, dry_run: bool = False, stats: dict | None = None
+) -> bool:
     """Attempt to delete a path. Returns True on success, False on failure.
 
     In dry-run mode this prints what would be removed and returns False.
+    Counts go to ``stats`` when given (see _new_stats), otherwise to STATS.
     """
+    # Work on a plain string from here on; Path objects are only for callers
+    path = os.fspath(path)
     try:
-        if not path.exists():
-            return True
         if _should_exclude(path):
-            STATS["skipped_by_exclude"] += 1
+            # Callers such as the browser cleanup probe optional names; only count
+            # an exclude for something that is actually there
+            if os.path.lexists(path):
+                _bump("skipped_by_exclude", stats=stats)
             return True
-        if not _passes_age_filter(path):
-            STATS["skipped_by_age"] += 1
+        # One lstat serves the existence, age and type checks below
+        try:
+            st = os.lstat(path)
+        except FileNotFoundError:
             return True
-        # Optional per-action confirmation
+        admitted = _admit(path, st, dry_run, stats)
+        if admitted is not True:
+            return admitted is None
+        if _is_tree(st):
+            freed, deleted = _fast_rmtree(path)
+            _bump("bytes_deleted", freed, stats=stats)
+            if deleted:
+                _bump("dirs_deleted", stats=stats)
+            return deleted
+        return _unlink_counted(path, st, stats)
+    except Exception:
+        _give_up(path, stats)
+        return False
+
+
+class _ParallelDeleter:
+    """Delete a set of entries, including their whole subtrees, on one pool of threads.
+
+    Every directory scan is its own task on a shared queue, so workers that finish
+    a small tree pick up directories from a large one. Files are unlinked as they
+    are found; directories are removed deepest first once all scans are done.
+    Top-level entries get the same checks and fallbacks as safe_delete. Each
+    worker counts into its own dict; run() returns their sum.
+    """
+
+    def __init__(self, workers: int, dry_run: bool = False):
+        self._workers = workers
+        self._dry_run = dry_run
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._dirs: list[tuple[int, str]] = []
+        self._counts: list[dict] = []
+
+    def _submit(self, fn, *args) -> None:
+        with self._lock:
+            self._pending += 1
+        self._queue.put((fn, args))
+
+    def _work(self, stats: dict) -> None:
+        while True:
+            task = self._queue.get()
+            if task is None:
+                return
+            fn, args = task
+            try:
+                if not _STOP.is_set():
+                    fn(*args, stats)
+            except Exception:
+                pass
+            finally:
+                with self._lock:
+                    self._pending -= 1
+                    done = self._pending == 0
+                if done:
+                    # Tasks only submit before finishing, so zero pending means no more work
+                    for _ in range(self._workers):
+                        self._queue.put(None)
+
+    def _entry(self, path: str, stats: dict) -> None:
         try:
-            if not _maybe_confirm(f"Delete {'directory' if path.is_dir() else 'file'}: {path}?", default_no=False):
-                _log(c(f"Skipped by user: {path}", _C.DIM), level=2)
-                return True
+            try:
+                st = os.lstat(path)
+            except FileNotFoundError:
+                return
+            if _admit(path, st, self._dry_run, stats) is not True:
+                return
+            if not _is_tree(st):
+                _unlink_counted(path, st, stats)
+                return
+            self._dirs.append((0, path))
+            self._scan(path, 0, stats)
         except Exception:
-            # If confirmation fails, do not proceed
-            return False
-        if dry_run:
-            _log(f"DRY-RUN would remove: {path}", level=2)
-            return False
-        bytes_before = _path_size_bytes(path)
-        if path.is_dir():
-            shutil.rmtree(path, ignore_errors=False, onerror=_on_rm_error)
-        else:
-            path.unlink()
-        deleted = not path.exists()
-        if deleted:
-            if path.is_dir():
-                STATS["dirs_deleted"] += 1
-            else:
-                STATS["files_deleted"] += 1
-            STATS["bytes_deleted"] += bytes_before
-        return deleted
-    except Exception:
+            _give_up(path, stats)
+
+    def _scan(self, path: str, depth: int, stats: dict) -> None:
         try:
-            os.chmod(path, 0o700)
-            if path.is_dir():
-                shutil.rmtree(path, ignore_errors=False, onerror=_on_rm_error)
-            else:
-                path.unlink()
-            deleted = not path.exists()
-            if deleted:
-                STATS["bytes_deleted"] += _path_size_bytes(path)
-            else:
-                STATS["locked_or_failed"] += 1
-            return deleted
+            with os.scandir(path) as it:
+                entries = list(it)
         except Exception:
-            # Schedule deletion on reboot as a last resort
+            return
+        freed = 0
+        for entry in entries:
+            if _STOP.is_set():
+                break
             try:
-                schedule_delete_on_reboot(path)
-                STATS["scheduled_on_reboot"] += 1
+                st = entry.stat(follow_symlinks=False)
+            except Exception:
+                continue
+            if _is_tree(st):
+                self._dirs.append((depth + 1, entry.path))
+                self._submit(self._scan, entry.path, depth + 1)
+            elif _remove_path(entry.path, _is_dir_link(st)):
+                freed += st.st_size
+        if freed:
+            stats["bytes_deleted"] += freed
+
+    def run(self, paths: list[str]) -> dict:
+        total = _new_stats()
+        for path in paths:
+            self._submit(self._entry, path)
+        if not self._pending:
+            return total
+        self._counts = [_new_stats() for _ in range(self._workers)]
+        # The calling thread is one of the workers, so ``workers`` is the thread count
+        threads = [
+            threading.Thread(target=self._work, args=(counts,), daemon=True)
+            for counts in self._counts[1:]
+        ]
+        for t in threads:
+            t.start()
+        self._work(self._counts[0])
+        for t in threads:
+            t.join()
+        # A child directory is always deeper than its parent
+        for depth, d in sorted(self._dirs, key=lambda item: item[0], reverse=True):
+            if _STOP.is_set():
+                break
+            if _remove_path(d, is_dir=True) and depth == 0:
+                total["dirs_deleted"] += 1
+        for counts in self._counts:
+            _add_counts(total, counts)
+        return total
+
+
+# More loose files than this in one directory are removed with batched SHFileOperationW calls
+BULK_DELETE_THRESHOLD = 64
+FO_DELETE = 0x0003
+FOF_NO_UI = 0x0614  # FOF_SILENT | FOF_NOCONFIRMATION | FOF_NOERRORUI | FOF_NOCONFIRMMKDIR
+FOF_ALLOWUNDO = 0x0040
+# Items per shell delete/recycle operation; larger batches stop paying off
+SHELL_BATCH_SIZE = 200
+
+
+def _shell_file_op(paths: list[str], flags: int) -> bool:
+    """Run one SHFileOperationW delete over ``paths``; True if nothing was left behind."""
+    # Encode explicitly: the shell wants UTF-16 code units, and a non-BMP name
+    # (e.g. an emoji) takes two of them
+    raw = ("\0".join(paths) + "\0\0").encode("utf-16-le", "surrogatepass")
+    buf = ctypes.create_string_buffer(raw, len(raw))
+    op = _SHFILEOPSTRUCTW()
+    op.wFunc = FO_DELETE
+    op.pFrom = ctypes.addressof(buf)
+    op.fFlags = flags
+    result = _SHFileOperationW(ctypes.byref(op))
+    return result == 0 and not op.fAnyOperationsAborted
+
+
+def bulk_delete_win32(paths: list[str]) -> list[str]:
+    """Permanently delete ``paths`` with SHFileOperationW, SHELL_BATCH_SIZE per call.
+
+    Returns the paths that are still present afterwards.
+    """
+    remaining: list[str] = []
+    for i in range(0, len(paths), SHELL_BATCH_SIZE):
+        batch = paths[i:i + SHELL_BATCH_SIZE]
+        try:
+            ok = _shell_file_op(batch, FOF_NO_UI)
+        except Exception:
+            ok = False
+        if not ok:
+            # The shell stops at the first failure; find out what is left
+            remaining.extend(p for p in batch if os.path.lexists(p))
+    return remaining
+
+
+def _shell_delete_files(entries: list[os.DirEntry], stats: dict | None = None) -> list[str]:
+    """Permanently delete loose files through bulk_delete_win32.
+
+    Freed bytes come from the cached DirEntry data. Returns the paths that are
+    still present so the caller can retry them through safe_delete.
+    """
+    sizes = {}
+    for entry in entries:
+        try:
+            sizes[entry.path] = entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            sizes[entry.path] = 0
+    remaining = bulk_delete_win32(list(sizes))
+    left = set(remaining)
+    removed = [p for p in sizes if p not in left]
+    _bump("files_deleted", len(removed), stats=stats)
+    _bump("bytes_deleted", sum(sizes[p] for p in removed), stats=stats)
+    return remaining
+
+
+def _recycle_with_ifileoperation(paths: list[str], silent: bool) -> None:
+    # One IFileOperation per batch: queue every item, then a single PerformOperations()
+    _pythoncom.CoInitialize()
+    try:
+        op = _pythoncom.CoCreateInstance(
+            _shell.CLSID_FileOperation, None, _pythoncom.CLSCTX_ALL, _shell.IID_IFileOperation
+        )
+        flags = _shellcon.FOF_ALLOWUNDO | _shellcon.FOFX_RECYCLEONDELETE | _shellcon.FOFX_EARLYFAILURE
+        if silent:
+            flags |= FOF_NO_UI
+        op.SetOperationFlags(flags)
+        for p in paths:
+            op.DeleteItem(_shell.SHCreateItemFromParsingName(p, None, _shell.IID_IShellItem), None)
+        op.PerformOperations()
+    finally:
+        _pythoncom.CoUninitialize()
+
+
+def shell_delete_batch(paths: list[str], silent: bool = True) -> None:
+    """Send ``paths`` to the Recycle Bin, one shell operation per SHELL_BATCH_SIZE items.
+
+    Uses IFileOperation when pywin32 is installed and falls back to
+    SHFileOperationW with FOF_ALLOWUNDO otherwise. Callers check afterwards
+    which paths are gone.
+    """
+    for i in range(0, len(paths), SHELL_BATCH_SIZE):
+        batch = paths[i:i + SHELL_BATCH_SIZE]
+        if _pythoncom is not None:
+            try:
+                _recycle_with_ifileoperation(batch, silent)
+                continue
+            except Exception:
+                # Early failure stops the batch; retry whatever is still there below
+                batch = [p for p in batch if os.path.lexists(p)]
+        if batch and _SHFileOperationW is not None:
+            try:
+                _shell_file_op(batch, FOF_ALLOWUNDO | (FOF_NO_UI if silent else 0))
             except Exception:
                 pass
-            STATS["locked_or_failed"] += 1
-            return False
 
 
-def delete_contents(dir_path: Path, dry_run: bool = False):
+def _recycle_entries(paths: list[str], stats: dict | None = None) -> None:
+    # Same per-entry checks as safe_delete, then one shell batch for everything admitted
+    admitted = []
+    for p in paths:
+        try:
+            st = os.lstat(p)
+        except FileNotFoundError:
+            continue
+        except Exception:
+            _bump("locked_or_failed", stats=stats)
+            continue
+        if _admit(p, st, False, stats) is True:
+            admitted.append(p)
+    if not admitted:
+        return
+    shell_delete_batch(admitted)
+    for p in admitted:
+        if os.path.lexists(p):
+            _bump("locked_or_failed", stats=stats)
+        else:
+            _bump("recycled", stats=stats)
+
+
+def delete_contents(
+    dir_path: str | Path,
+    dry_run: bool = False,
+    parallel: bool = False,
+    workers: int | None = None,
+    recycle: bool = False,
+) -> dict:
+    """Delete everything inside ``dir_path`` (but not the directory itself).
+
+    By default the top-level entries are spread over a thread pool and each
+    subtree is removed serially. ``parallel=True`` instead shares one work queue
+    across every subtree, which pays off for deep trees; ``workers`` defaults to
+    --threads. ``recycle=True`` sends the entries to the Recycle Bin in batches.
+
+    Returns this call's counters (see _new_stats) instead of updating STATS on
+    every file; callers merge them with _merge_stats.
+    """
+    counts = _new_stats()
     try:
-        if not dir_path.exists():
-            return
-        for entry in dir_path.iterdir():
-            safe_delete(entry, dry_run=dry_run)
+        # A missing directory raises here and is skipped below; an empty one (the
+        # common case after a previous run) returns before any further work.
+        with os.scandir(os.path.abspath(dir_path)) as it:
+            first = next(it, None)
+            if first is None:
+                return counts
+            scanned = [first, *it]
+        days: int | None = CONFIG.get("older_than_days")
+        entries = [entry.path for entry in scanned]
+        if CONFIG.get("_exclude_re") is not None or CONFIG.get("_exclude_name_re") is not None:
+            # Listed by scandir, so these exist: drop and count excludes up front
+            entries = [p for p in entries if not _excluded(p, counts)]
+        if recycle and not dry_run:
+            _recycle_entries(entries, counts)
+            return counts
+        # Without per-entry filters or prompts, hand loose files to the shell in one
+        # batch; directories and anything left behind still go through safe_delete.
+        if (
+            _SHFileOperationW is not None
+            and len(scanned) > BULK_DELETE_THRESHOLD
+            and not dry_run
+            and not CONFIG.get("confirm_each", False)
+            and CONFIG.get("_exclude_re") is None
+            and CONFIG.get("_exclude_name_re") is None
+            and not (days and days > 0)
+        ):
+            files = [entry for entry in scanned if entry.is_file(follow_symlinks=False)]
+            if len(files) > BULK_DELETE_THRESHOLD:
+                file_paths = {entry.path for entry in files}
+                try:
+                    left = _shell_delete_files(files, counts)
+                except Exception:
+                    # Anything unexpected: the per-entry loop below handles every file
+                    left = [entry.path for entry in files if os.path.lexists(entry.path)]
+                entries = [p for p in entries if p not in file_paths] + left
+        workers = max(1, workers or CONFIG.get("threads", 8))
+        # Per-action prompts must stay sequential
+        sequential = workers <= 1 or CONFIG.get("confirm_each", False)
+        if parallel and not sequential:
+            _add_counts(counts, _ParallelDeleter(workers, dry_run=dry_run).run(entries))
+            return counts
+        workers = min(workers, len(entries))
+        if sequential or workers <= 1:
+            for entry in entries:
+                if _STOP.is_set():
+                    break
+                safe_delete(entry, dry_run=dry_run, stats=counts)
+            return counts
+
+        def delete_one(entry: str) -> dict:
+            local = _new_stats()
+            if not _STOP.is_set():
+                safe_delete(entry, dry_run=dry_run, stats=local)
+            return local
+
+        # Deleting is dominated by per-file syscall latency and the GIL is released
+        # around filesystem calls, so fan out the top-level entries. Recursion inside
+        # each entry stays serial to keep the thread count bounded.
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for local in pool.map(delete_one, entries):
+                _add_counts(counts, local)
     except Exception:
         # Skip unreadable directories
         pass
+    return counts
+
+
+def _add_unique(seen: set[str], out: list[Path], p: Path) -> None:
+    # Key on the real, case-folded path so aliases (e.g. %TEMP% and
+    # %LOCALAPPDATA%\Temp, 8.3 short names, junctions) are only traversed once.
+    # realpath also handles missing paths, so no separate exists() check is needed.
+    key = os.path.normcase(os.path.realpath(p)).lower()
+    if key not in seen:
+        seen.add(key)
+        out.append(p)
+
+
+def _iter_user_dirs(users_root: Path):
+    """Yield the names of profile folders under ``users_root``.
+
+    A missing root raises from scandir; the file/dir bit comes from the directory
+    listing itself, so no per-entry stat is made.
+    """
+    with os.scandir(users_root) as it:
+        for entry in it:
+            # Skip well-known non-user directories
+            if entry.name in {"All Users", "Default", "Default User", "Public"}:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield entry.name
 
 
 def get_common_paths() -> list[Path]:
     paths: list[Path] = []
+    seen: set[str] = set()
     try:
-        paths.append(Path(tempfile.gettempdir()))
+        _add_unique(seen, paths, Path(tempfile.gettempdir()))
     except Exception:
         pass
     localapp = os.environ.get("LOCALAPPDATA")
     if localapp:
-        paths.append(Path(localapp) / "Temp")
+        _add_unique(seen, paths, Path(localapp) / "Temp")
     # Explicit TEMP/TMP envs if different
     for env_name in ("TEMP", "TMP"):
         env_val = os.environ.get(env_name)
         if env_val:
             try:
-                p = Path(env_val)
-                if p not in paths:
-                    paths.append(p)
+                _add_unique(seen, paths, Path(env_val))
             except Exception:
                 pass
     windir = os.environ.get("WINDIR", r"C:\\Windows")
-    paths.append(Path(windir) / "Temp")
-    paths.append(Path(windir) / "Prefetch")
+    _add_unique(seen, paths, Path(windir) / "Temp")
+    _add_unique(seen, paths, Path(windir) / "Prefetch")
     # Add all user profile temp directories to handle elevation context
     users_root = Path(os.environ.get("SystemDrive", "C:")) / "Users"
     try:
-        if users_root.exists():
-            for user_dir in users_root.iterdir():
-                # Skip well-known non-user directories
-                if user_dir.name in {"All Users", "Default", "Default User", "Public"}:
-                    continue
-                candidate = user_dir / "AppData" / "Local" / "Temp"
-                if candidate.exists():
-                    paths.append(candidate)
+        for name in _iter_user_dirs(users_root):
+            candidate = users_root / name / "AppData" / "Local" / "Temp"
+            if candidate.exists():
+                _add_unique(seen, paths, candidate)
     except Exception:
         pass
     # Service profiles temps
@@ -346,7 +1238,7 @@ def get_common_paths() -> list[Path]:
         try:
             svc_temp = service_profiles / svc / "AppData" / "Local" / "Temp"
             if svc_temp.exists():
-                paths.append(svc_temp)
+                _add_unique(seen, paths, svc_temp)
         except Exception:
             pass
     return paths
@@ -364,10 +1256,7 @@ def get_grouped_paths() -> dict[str, list[Path]]:
     # Current user/process temps
     seen: set[str] = set()
     def add_unique(target_key: str, p: Path):
-        key = str(p.resolve()) if p.exists() else str(p)
-        if key.lower() not in seen:
-            seen.add(key.lower())
-            grouped[target_key].append(p)
+        _add_unique(seen, grouped[target_key], p)
 
     try:
         add_unique("current_user_temp", Path(tempfile.gettempdir()))
@@ -392,12 +1281,8 @@ def get_grouped_paths() -> dict[str, list[Path]]:
     # All users temps
     users_root = Path(os.environ.get("SystemDrive", "C:")) / "Users"
     try:
-        if users_root.exists():
-            for user_dir in users_root.iterdir():
-                if user_dir.name in {"All Users", "Default", "Default User", "Public"}:
-                    continue
-                candidate = user_dir / "AppData" / "Local" / "Temp"
-                add_unique("users_temp", candidate)
+        for name in _iter_user_dirs(users_root):
+            add_unique("users_temp", users_root / name / "AppData" / "Local" / "Temp")
     except Exception:
         pass
 
@@ -412,30 +1297,124 @@ def get_grouped_paths() -> dict[str, list[Path]]:
     return grouped
 
 
+TH32CS_SNAPPROCESS = 0x00000002
+PROCESS_TERMINATE = 0x0001
+INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+
+def _find_process_ids(names: set[str]) -> list[int]:
+    # Walk a Toolhelp process snapshot; names must be lowercase executable names
+    snapshot = _CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    if not snapshot or snapshot == INVALID_HANDLE_VALUE:
+        return []
+    pids: list[int] = []
+    try:
+        entry = _PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(_PROCESSENTRY32W)
+        ok = _Process32FirstW(snapshot, ctypes.byref(entry))
+        while ok:
+            if entry.szExeFile.lower() in names:
+                pids.append(entry.th32ProcessID)
+            ok = _Process32NextW(snapshot, ctypes.byref(entry))
+    finally:
+        _CloseHandle(snapshot)
+    return pids
+
+
+def _terminate_processes(pids: list[int]) -> None:
+    for pid in pids:
+        handle = _OpenProcess(PROCESS_TERMINATE, False, pid)
+        if not handle:
+            continue
+        try:
+            _TerminateProcess(handle, 1)
+        finally:
+            _CloseHandle(handle)
+
+
 def taskkill_processes(names: list[str], force: bool = False, wait_seconds: float = 2.0):
     """
     Attempt to close processes for given executable names.
-    If force is False, try a polite shutdown first and wait; if any remain and force=True, use /F.
+    If force is False, ask them to close with a single taskkill call and wait; if
+    force=True, terminate them directly in-process (no taskkill.exe launches).
     """
+    selected: list[str] = []
     for name in names:
+        # Optional per-action confirmation for each process name
+        if not _maybe_confirm(f"Close processes named {name}?", default_no=False):
+            _log(c(f"Skipped closing processes: {name}", _C.DIM), level=2)
+            continue
+        selected.append(name)
+    if not selected:
+        return
+    if force:
         try:
-            # Optional per-action confirmation for each process name
-            if not _maybe_confirm(f"Close processes named {name}?", default_no=False):
-                _log(c(f"Skipped closing processes: {name}", _C.DIM), level=2)
-                continue
-            # Try graceful shutdown first
-            subprocess.run(["taskkill", "/IM", name], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
-            time.sleep(wait_seconds)
-            if force:
-                # Force-kill any remaining
-                subprocess.run(["taskkill", "/F", "/IM", name, "/T"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+            _terminate_processes(_find_process_ids({name.lower() for name in selected}))
+            return
         except Exception:
+            # Toolhelp unavailable: fall back to taskkill below
             pass
+    try:
+        cmd = ["taskkill"]
+        if force:
+            cmd.append("/F")
+        for name in selected:
+            cmd += ["/IM", name]
+        if force:
+            cmd.append("/T")
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        if not force:
+            time.sleep(wait_seconds)
+    except Exception:
+        pass
+
+
+async def _delete_contents_many(targets: list[str | Path], dry_run: bool = False, max_workers: int | None = None) -> None:
+    # Cache directories are independent I/O-bound jobs: run them all at once on
+    # one shared executor (--threads workers by default) instead of one after
+    # another. Each delete_contents call stays single-threaded so the executor
+    # size is the real thread count. --confirm-each runs one folder at a time so
+    # prompts do not interleave.
+    loop = asyncio.get_running_loop()
+    if CONFIG.get("confirm_each", False):
+        max_workers = 1
+    else:
+        max_workers = max(1, max_workers or CONFIG.get("threads", 8))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = await asyncio.gather(*[
+            loop.run_in_executor(pool, functools.partial(delete_contents, target, dry_run=dry_run, workers=1))
+            for target in targets
+        ])
+    for counts in results:
+        _merge_stats(counts)
+
+
+# Per-profile Chromium entries, allocated once instead of per profile
+CHROMIUM_CACHE_DIRS = (
+    "Cache", "Code Cache", "GPUCache", "Service Worker",
+    "DawnCache", "ShaderCache", "GrShaderCache", "Media Cache",
+)
+CHROMIUM_HISTORY_FILES = ("History", "History-journal", "History Provider Cache", "Network Action Predictor")
+CHROMIUM_EXTRA_FILES = ("Top Sites", "Shortcuts", "Visited Links", "Favicons", "Web Data")
+
+
+def _iter_dirs(root: str | Path):
+    # The directory bit comes from the scandir entry itself, so no stat per child
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield entry.path
+                except OSError:
+                    continue
+    except OSError:
+        return
 
 
 def clean_browser_histories(dry_run: bool = False, force: bool = False):
-    # Close common browser processes to unlock files. Try graceful first; if
-    # force=True we will escalate to /F after waiting.
+    # Close common browser processes to unlock files. Ask politely unless
+    # force=True, in which case they are terminated right away.
     taskkill_processes([
         "chrome.exe", "msedge.exe", "firefox.exe",
         "brave.exe", "opera.exe"
@@ -457,62 +1436,57 @@ def clean_browser_histories(dry_run: bool = False, force: bool = False):
         localapp / "Opera Software" / "Opera GX Stable",
     ]
 
+    # Cache directories are collected across every profile and emptied together at the end
+    cache_targets: list[str] = []
+
     for root in chromium_targets:
-        if not root.exists():
-            continue
-        for profile in root.glob("*"):
-            if not profile.is_dir():
-                continue
-            for cache_dir_name in [
-                "Cache", "Code Cache", "GPUCache", "Service Worker",
-                "DawnCache", "ShaderCache", "GrShaderCache", "Media Cache"
-            ]:
-                delete_contents(profile / cache_dir_name, dry_run=dry_run)
-
-            for hist_name in ["History", "History-journal", "History Provider Cache", "Network Action Predictor"]:
-                target = profile / hist_name
-                # Backup first if possible
+        for profile in _iter_dirs(root):
+            for cache_dir_name in CHROMIUM_CACHE_DIRS:
+                cache_targets.append(os.path.join(profile, cache_dir_name))
+
+            for hist_name in CHROMIUM_HISTORY_FILES:
+                target = os.path.join(profile, hist_name)
+                # safe_delete returns True for missing paths, so False means the file
+                # exists and was kept (dry-run already showed it); no exists() probe
                 ok = safe_delete(target, dry_run=dry_run)
-                if not ok and target.exists():
-                    if dry_run:
-                        # already shown
-                        pass
-                    else:
-                        print(c(f"  Could not remove: {target} (in use or permission denied)", _C.YELLOW))
+                if not ok and not dry_run:
+                    print(c(f"  Could not remove: {target} (in use or permission denied)", _C.YELLOW))
 
-            for extra_name in ["Top Sites", "Shortcuts", "Visited Links", "Favicons", "Web Data"]:
-                target = profile / extra_name
+            for extra_name in CHROMIUM_EXTRA_FILES:
+                target = os.path.join(profile, extra_name)
                 ok = safe_delete(target, dry_run=dry_run)
-                if not ok and target.exists():
-                    if not dry_run:
-                        print(c(f"  Could not remove: {target}", _C.YELLOW))
+                if not ok and not dry_run:
+                    print(c(f"  Could not remove: {target}", _C.YELLOW))
 
     # Firefox
     ff_profiles_root = appdata / "Mozilla" / "Firefox" / "Profiles"
     ff_local_profiles_root = localapp / "Mozilla" / "Firefox" / "Profiles"
 
-    def clean_firefox_profile(profile_dir: Path):
+    def clean_firefox_profile(profile_dir: str):
         for fname in ("places.sqlite", "places.sqlite-wal", "places.sqlite-shm"):
-            target = profile_dir / fname
+            target = os.path.join(profile_dir, fname)
             ok = safe_delete(target, dry_run=dry_run)
-            if not ok and target.exists() and not dry_run:
+            if not ok and not dry_run:
                 print(c(f"  Could not remove: {target}", _C.YELLOW))
 
         for f in [
             "formhistory.sqlite", "formhistory.sqlite-wal", "formhistory.sqlite-shm",
             "downloads.sqlite", "downloads.json", "sessionstore.jsonlz4"
         ]:
-            ok = safe_delete(profile_dir / f, dry_run=dry_run)
-            if not ok and (profile_dir / f).exists() and not dry_run:
-                print(c(f"  Could not remove: {profile_dir / f}", _C.YELLOW))
-        delete_contents(profile_dir / "cache2", dry_run=dry_run)
-        delete_contents(profile_dir / "startupCache", dry_run=dry_run)
+            target = os.path.join(profile_dir, f)
+            ok = safe_delete(target, dry_run=dry_run)
+            if not ok and not dry_run:
+                print(c(f"  Could not remove: {target}", _C.YELLOW))
+        cache_targets.append(os.path.join(profile_dir, "cache2"))
+        cache_targets.append(os.path.join(profile_dir, "startupCache"))
 
     for root in [ff_profiles_root, ff_local_profiles_root]:
-        if root.exists():
-            for profile in root.glob("*.default*"):
-                if profile.is_dir():
-                    clean_firefox_profile(profile)
+        for profile in _iter_dirs(root):
+            if fnmatch.fnmatch(os.path.basename(profile), "*.default*"):
+                clean_firefox_profile(profile)
+
+    if cache_targets:
+        asyncio.run(_delete_contents_many(cache_targets, dry_run=dry_run))
 
 
 def do_update_upgrade():
@@ -544,7 +1518,7 @@ def empty_recycle_bin(dry_run: bool = False, silent: bool = True):
         if silent:
             flags |= SHERB_NOCONFIRMATION | SHERB_NOPROGRESSUI | SHERB_NOSOUND
         # hwnd = None (0), pszRootPath = None to target all drives
-        res = ctypes.windll.shell32.SHEmptyRecycleBinW(None, None, flags)
+        res = _SHEmptyRecycleBinW(None, None, flags)
         # SHEmptyRecycleBin returns HRESULT; 0 means S_OK
         if res != 0:
             # Non-zero HRESULT, still continue without raising
@@ -560,42 +1534,64 @@ def empty_recycle_bin(dry_run: bool = False, silent: bool = True):
             pass
 
 
-def schedule_delete_on_reboot(path: Path) -> None:
+def schedule_delete_on_reboot(path: str | Path) -> None:
     # Use MoveFileExW with MOVEFILE_DELAY_UNTIL_REBOOT to delete after reboot
     MOVEFILE_DELAY_UNTIL_REBOOT = 0x00000004
     try:
-        ctypes.windll.kernel32.MoveFileExW(str(path), None, MOVEFILE_DELAY_UNTIL_REBOOT)
+        _MoveFileExW(str(path), None, MOVEFILE_DELAY_UNTIL_REBOOT)
     except Exception:
         pass
 
 
-def clean_prefetch(prefetch_dir: Path, dry_run: bool = False):
-    # Prefetch often has protected files like Layout.ini; delete only .pf entries
+def _prefetch_has_work(prefetch_dirs: list[Path]) -> bool:
+    """True unless every Prefetch folder is readable and holds nothing but Layout.ini.
+
+    A folder that cannot be listed (usually for lack of rights) counts as having
+    work, so it is still cleaned or queued for elevation.
+    """
+    for d in prefetch_dirs:
+        try:
+            with os.scandir(d) as it:
+                if any(entry.name.lower() != "layout.ini" for entry in it):
+                    return True
+        except FileNotFoundError:
+            continue
+        except Exception:
+            return True
+    return False
+
+
+def clean_prefetch(prefetch_dir: str | Path, dry_run: bool = False, workers: int | None = 1) -> dict:
+    # Prefetch often has protected files like Layout.ini; delete only .pf entries.
+    # Counts go into this call's own counters (see _new_stats), returned to the caller.
+    counts = _new_stats()
     try:
-        if not prefetch_dir.exists():
-            return
-        for entry in prefetch_dir.iterdir():
-            try:
-                if entry.is_file():
-                    if entry.suffix.lower() == ".pf":
-                        safe_delete(entry, dry_run=dry_run)
-                    elif entry.name.lower() == "layout.ini":
-                        # skip
-                        continue
-                    else:
-                        # best-effort delete other temp-like files
-                        safe_delete(entry, dry_run=dry_run)
-                elif entry.is_dir():
-                    # Rare in Prefetch; attempt best-effort
-                    delete_contents(entry, dry_run=dry_run)
-                    safe_delete(entry, dry_run=dry_run)
-            except Exception:
+        # scandir entries carry the file/dir bits, so no stat per entry
+        with os.scandir(prefetch_dir) as it:
+            for entry in it:
                 try:
-                    schedule_delete_on_reboot(entry)
+                    lname = entry.name.lower()
+                    if entry.is_file(follow_symlinks=False):
+                        if lname.endswith(".pf"):
+                            safe_delete(entry.path, dry_run=dry_run, stats=counts)
+                        elif lname == "layout.ini":
+                            # skip
+                            continue
+                        else:
+                            # best-effort delete other temp-like files
+                            safe_delete(entry.path, dry_run=dry_run, stats=counts)
+                    elif entry.is_dir(follow_symlinks=False):
+                        # Rare in Prefetch; attempt best-effort
+                        _add_counts(counts, delete_contents(entry.path, dry_run=dry_run, workers=workers))
+                        safe_delete(entry.path, dry_run=dry_run, stats=counts)
                 except Exception:
-                    pass
+                    try:
+                        schedule_delete_on_reboot(entry.path)
+                    except Exception:
+                        pass
     except Exception:
         pass
+    return counts
 
 
 def prompt_yes_no(prompt: str, default_no: bool, assume_yes: bool | None) -> bool:
@@ -620,7 +1616,7 @@ def prompt_yes_no(prompt: str, default_no: bool, assume_yes: bool | None) -> boo
             title = "Windows Care - Confirmation"
             # Use MessageBoxW - simple approach
             try:
-                result = ctypes.windll.user32.MessageBoxW(0, prompt, title, flags)
+                result = _MessageBoxW(None, prompt, title, flags)
                 # IDYES = 6, IDNO = 7, IDCANCEL = 2, 0 = error
                 if result == 6:  # IDYES
                     return True
@@ -694,6 +1690,8 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
     parser.add_argument("--dry-run", action="store_true", help="Do not delete anything; just show actions")
     # Internal flag to indicate the process has already relaunched elevated
     parser.add_argument("--_elevated", action="store_true", help=argparse.SUPPRESS)
+    # Internal: elevated helper that runs the admin-only cleanups listed in PATH
+    parser.add_argument("--_admin-batch", dest="_admin_batch", default=None, help=argparse.SUPPRESS)
     parser.add_argument("--force", action="store_true", help="Force kill browsers and force delete locked files")
     # New flags
     parser.add_argument("--older-than", type=int, default=None, metavar="DAYS", help="Only delete items older than DAYS")
@@ -703,6 +1701,8 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
     parser.add_argument("-q", "--quiet", action="store_true", help="Quiet mode (errors and summary only)")
     parser.add_argument("-v", "--verbose", action="count", default=0, help="Increase verbosity (-v, -vv)")
     parser.add_argument("--confirm-each", action="store_true", help="Prompt yes/no before each individual action")
+    parser.add_argument("--to-recycle", action="store_true", help="Send ALL USERS' temp items to the Recycle Bin instead of deleting them")
+    parser.add_argument("--threads", type=int, default=8, metavar="N", help="Worker threads used when deleting directory contents (default: 8)")
     ns = parser.parse_args(argv)
     # If environment variable CLEANUP_FORCE_PROMPTS is set, ensure prompts are shown
     try:
@@ -714,6 +1714,17 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
     return ns
 
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
+def _fmt_size(n: int) -> str:
+    # Each unit is 10 more bits, so bit_length() picks it without a division loop
+    shift = min(max(0, (n.bit_length() - 1) // 10), len(_SIZE_UNITS) - 1)
+    if shift == 0:
+        return f"{n} B"
+    return f"{n / (1 << (shift * 10)):.2f} {_SIZE_UNITS[shift]}"
+
+
 def pause_on_error():
     """Pause before exiting when running as exe, so user can see error messages."""
     is_frozen = getattr(sys, 'frozen', False) or hasattr(sys, '_MEIPASS')
@@ -724,6 +1735,135 @@ def pause_on_error():
             pass
 
 
+# Finished-root lines printed per console write in _clean_all
+NOTE_BATCH_SIZE = 32
+
+
+async def _clean_all(jobs: list[tuple[list[Path], object, dict]], dry_run: bool = False) -> None:
+    """Run every ``(roots, worker, kwargs)`` job's roots concurrently on one executor.
+
+    The roots of all selected groups share a single pool of --threads workers, so
+    a group with many user profiles does not wait behind a slow Windows Temp.
+    Each root's worker gets an equal share of --threads, so the roots running
+    at once never use more than --threads threads between them.
+    The spinner advances with a done/total count as each root finishes; the
+    per-root lines are printed in batches of NOTE_BATCH_SIZE. --confirm-each
+    runs one root at a time so prompts do not interleave. If the run is
+    interrupted, _STOP makes the roots already running return early.
+    """
+    roots = [(root, worker, kwargs) for paths, worker, kwargs in jobs for root in paths]
+    if not roots:
+        return
+    threads = max(1, CONFIG.get("threads", 8))
+    limit = 1 if CONFIG.get("confirm_each", False) else min(threads, len(roots))
+    # The executor thread running a root is one of that root's workers
+    per_root = max(1, threads // limit)
+    loop = asyncio.get_running_loop()
+    lines: list[str] = []
+    done = 0
+
+    async def clean_one(pool: ThreadPoolExecutor, root: Path, worker, kwargs: dict) -> None:
+        nonlocal done
+        try:
+            # Workers return their own counters; merge once per root
+            result = await loop.run_in_executor(pool, functools.partial(worker, root, dry_run=dry_run, workers=per_root, **kwargs))
+            _merge_stats(result)
+            lines.append(c(f" → {root}", _C.DIM))
+        except Exception as e:
+            lines.append(c(f"  Skipped {root}: {e}", _C.YELLOW))
+        done += 1
+        # The lines go out in batches; the spinner itself moves on every root
+        if len(lines) >= NOTE_BATCH_SIZE:
+            Spinner.note("\n".join(lines))
+            lines.clear()
+        Spinner.tick(f"{done}/{len(roots)}")
+
+    pool = ThreadPoolExecutor(max_workers=limit)
+    try:
+        await asyncio.gather(*[clean_one(pool, root, worker, kwargs) for root, worker, kwargs in roots])
+    except BaseException:
+        # Interrupted: make the running roots return early instead of finishing
+        _STOP.set()
+        raise
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+    if lines:
+        Spinner.note("\n".join(lines))
+
+
+def _contents_kwargs() -> dict:
+    return {"parallel": True}
+
+
+def _users_temp_kwargs() -> dict:
+    # --to-recycle applies to the other users' Temp folders only
+    return {"parallel": True, "recycle": CONFIG.get("to_recycle", False)}
+
+
+def _prefetch_kwargs() -> dict:
+    return {}
+
+
+class _Task(NamedTuple):
+    """One temp/prefetch cleanup step of main. Groups in ADMIN_GROUPS need elevation."""
+
+    key: str  # group key in get_grouped_paths
+    label: str
+    prompt: str
+    default_no: bool
+    worker: Callable[..., dict]
+    # Returns the worker's extra arguments; called once CONFIG is set up
+    kwargs: Callable[[], dict]
+    # If given, called with the group's paths; the step is skipped when it is False
+    has_work: Callable[[list[Path]], bool] | None = None
+
+
+# The temp/prefetch cleanups, in prompt order
+_TASKS = (
+    _Task(
+        "current_user_temp",
+        "CURRENT user's TEMP",
+        "Clean CURRENT user's TEMP directories (%TEMP%, %TMP%, %LOCALAPPDATA%\\Temp)?",
+        False,
+        delete_contents,
+        _contents_kwargs,
+    ),
+    _Task(
+        "users_temp",
+        "ALL USERS' Local Temp",
+        "Clean ALL USERS' Local Temp directories (C:\\Users\\*\\AppData\\Local\\Temp)?",
+        True,
+        delete_contents,
+        _users_temp_kwargs,
+    ),
+    _Task(
+        "service_temp",
+        "SERVICE profiles Temp",
+        "Clean SERVICE profiles Temp (LocalService/NetworkService)?",
+        True,
+        delete_contents,
+        _contents_kwargs,
+    ),
+    _Task(
+        "windows_temp",
+        "WINDOWS Temp",
+        "Clean WINDOWS Temp (C:\\Windows\\Temp)?",
+        False,
+        delete_contents,
+        _contents_kwargs,
+    ),
+    _Task(
+        "prefetch",
+        "PREFETCH",
+        "Clean PREFETCH (.pf files only)?",
+        True,
+        clean_prefetch,
+        _prefetch_kwargs,
+        _prefetch_has_work,
+    ),
+)
+
+
 def main(argv: list[str]) -> int:
     try:
         if not is_windows():
@@ -746,131 +1886,85 @@ def main(argv: list[str]) -> int:
         CONFIG["dry_run"] = bool(args.dry_run)
         CONFIG["older_than_days"] = args.older_than if getattr(args, "older_than", None) else None
         CONFIG["exclude_patterns"] = list(args.exclude or [])
+        # Compiled once here; the delete loops only ever run the two regexes
+        CONFIG["_exclude_name_re"] = _compile_excludes(_name_patterns(CONFIG["exclude_patterns"]))
+        CONFIG["_exclude_re"] = _compile_excludes(CONFIG["exclude_patterns"])
         CONFIG["log_file"] = Path(args.log_file).resolve() if getattr(args, "log_file", None) else None
         CONFIG["confirm_each"] = bool(getattr(args, "confirm_each", False))
-        CONFIG["assume_yes"] = True if args.yes else (False if args.no else None)
+        # Resolved once; every prompt below reuses the same answer
+        assume_yes = True if args.yes else (False if args.no else None)
+        CONFIG["assume_yes"] = assume_yes
+        CONFIG["threads"] = max(1, args.threads)
+        CONFIG["to_recycle"] = bool(args.to_recycle)
+
+        def decide(question: str, default_no: bool) -> bool:
+            # With --yes/--no the answer is already known; skip the prompt machinery
+            if assume_yes is not None:
+                return assume_yes
+            return prompt_yes_no(question, default_no=default_no, assume_yes=None)
 
         if CONFIG["exclude_patterns"]:
             _log(c(f"Excluding patterns: {CONFIG['exclude_patterns']}", _C.DIM), level=2)
         if CONFIG["older_than_days"]:
             _log(c(f"Deleting only items older than {CONFIG['older_than_days']} day(s)", _C.DIM), level=1)
 
+        if args._admin_batch:
+            with Spinner("Cleaning administrator-only locations ..."):
+                return _handle_admin_batch(Path(args._admin_batch))
+
         # NOTE: We no longer force elevation at startup. Elevation is only requested
         # when the user opts into operations that require Administrator (e.g. clean
         # ALL USERS' temps, Windows Temp, Prefetch, service profiles). This avoids
         # unnecessary UAC/SmartScreen prompts when the user only wants to clean their
-        # current user's data (browser history, current temp).
+        # current user's data (browser history, current temp). Those operations are
+        # queued and handed to a single elevated helper after the prompts.
+        admin_jobs: list[tuple[str, Path]] = []
+        needs_elevation = not args.dry_run and not is_admin() and not args._elevated
 
         # 1) Clean Temp and Prefetch with per-category prompts
         print(c("Cleanup options:", _C.BOLD))
         groups = get_grouped_paths()
 
-        # Current user temp
-        if prompt_yes_no(
-            "Clean CURRENT user's TEMP directories (%TEMP%, %TMP%, %LOCALAPPDATA%\\Temp)?",
-            default_no=False,
-            assume_yes=(True if args.yes else (False if args.no else None)),
-        ):
-            with Spinner("Cleaning CURRENT user temp ..."):
-                for p in groups["current_user_temp"]:
-                    try:
-                        print(c(f" → {p}", _C.DIM))
-                        delete_contents(p, dry_run=args.dry_run)
-                    except Exception as e:
-                        print(c(f"  Skipped {p}: {e}", _C.YELLOW))
-        else:
-            print(c("Skipped CURRENT user's TEMP.", _C.DIM))
-
-        # All users' local temp
-        if prompt_yes_no(
-            "Clean ALL USERS' Local Temp directories (C:\\Users\\*\\AppData\\Local\\Temp)?",
-            default_no=True,
-            assume_yes=(True if args.yes else (False if args.no else None)),
-        ):
-            # This operation requires Administrator rights. If we are not elevated,
-            # relaunch elevated and pass an internal marker to avoid loops.
-            if not args.dry_run and not is_admin() and not args._elevated:
-                print("Administrator privileges are required to clean ALL USERS' Local Temp. Requesting elevation...")
-                relaunch_as_admin(argv)
-                return 0
-            with Spinner("Cleaning ALL users' temp ..."):
-                for p in groups["users_temp"]:
-                    try:
-                        print(c(f" → {p}", _C.DIM))
-                        delete_contents(p, dry_run=args.dry_run)
-                    except Exception as e:
-                        print(c(f"  Skipped {p}: {e}", _C.YELLOW))
-        else:
-            print(c("Skipped ALL USERS' Local Temp.", _C.DIM))
-
-        # Service profiles temp
-        if prompt_yes_no(
-            "Clean SERVICE profiles Temp (LocalService/NetworkService)?",
-            default_no=True,
-            assume_yes=(True if args.yes else (False if args.no else None)),
-        ):
-            if not args.dry_run and not is_admin() and not args._elevated:
-                print("Administrator privileges are required to clean SERVICE profiles Temp. Requesting elevation...")
-                relaunch_as_admin(argv)
-                return 0
-            with Spinner("Cleaning service profiles temp ..."):
-                for p in groups["service_temp"]:
-                    try:
-                        print(c(f" → {p}", _C.DIM))
-                        delete_contents(p, dry_run=args.dry_run)
-                    except Exception as e:
-                        print(c(f"  Skipped {p}: {e}", _C.YELLOW))
-        else:
-            print(c("Skipped SERVICE profiles Temp.", _C.DIM))
+        # Ask every question first so the cleanups below (and the single elevation
+        # request) run without stopping for input in between
+        selections = {task.key: decide(task.prompt, default_no=task.default_no) for task in _TASKS}
+
+        # Everything that can run in this process is collected first and then
+        # cleaned in one go, with the roots of all groups sharing one worker pool
+        local_jobs: list[tuple[list[Path], object, dict]] = []
+        for task in _TASKS:
+            paths = groups[task.key]
+            if not selections[task.key]:
+                print(c(f"Skipped {task.label}.", _C.DIM))
+                continue
+            if task.has_work is not None and not task.has_work(paths):
+                print(c(f"Nothing to clean in {task.label}.", _C.DIM))
+                continue
+            if task.key in ADMIN_GROUPS and needs_elevation:
+                # Administrator-only; queue it for the elevated helper started
+                # after the local cleanups
+                print(f"Administrator privileges are required to clean {task.label}. Queued for elevation.")
+                admin_jobs.extend((task.key, p) for p in paths)
+                continue
+            local_jobs.append((paths, task.worker, task.kwargs()))
 
-        # Windows Temp
-        if prompt_yes_no(
-            "Clean WINDOWS Temp (C:\\Windows\\Temp)?",
-            default_no=False,
-            assume_yes=(True if args.yes else (False if args.no else None)),
-        ):
-            if not args.dry_run and not is_admin() and not args._elevated:
-                print("Administrator privileges are required to clean WINDOWS Temp. Requesting elevation...")
-                relaunch_as_admin(argv)
-                return 0
-            with Spinner("Cleaning Windows temp ..."):
-                for p in groups["windows_temp"]:
-                    try:
-                        print(c(f" → {p}", _C.DIM))
-                        delete_contents(p, dry_run=args.dry_run)
-                    except Exception as e:
-                        print(c(f"  Skipped {p}: {e}", _C.YELLOW))
-        else:
-            print(c("Skipped WINDOWS Temp.", _C.DIM))
+        if local_jobs:
+            with Spinner("Cleaning selected temp locations ..."):
+                asyncio.run(_clean_all(local_jobs, dry_run=args.dry_run))
 
-        # Prefetch
-        if prompt_yes_no(
-            "Clean PREFETCH (.pf files only)?",
-            default_no=True,
-            assume_yes=(True if args.yes else (False if args.no else None)),
-        ):
-            if not args.dry_run and not is_admin() and not args._elevated:
-                print("Administrator privileges are required to clean PREFETCH. Requesting elevation...")
-                relaunch_as_admin(argv)
-                return 0
-            with Spinner("Cleaning Prefetch (.pf) ..."):
-                for p in groups["prefetch"]:
-                    try:
-                        print(c(f" → {p}", _C.DIM))
-                        clean_prefetch(p, dry_run=args.dry_run)
-                    except Exception as e:
-                        print(c(f"  Skipped {p}: {e}", _C.YELLOW))
-        else:
-            print(c("Skipped PREFETCH.", _C.DIM))
+        if admin_jobs:
+            print("Requesting elevation once for the queued administrator cleanups...")
+            # Wait for the helper so nothing below (e.g. emptying the Recycle Bin)
+            # races its deletions and its counts land in the summary
+            with Spinner("Waiting for the elevated helper to finish ..."):
+                done = _run_admin_batch(argv, admin_jobs)
+            if not done:
+                print(c("Elevation was cancelled or failed; administrator cleanups were skipped.", _C.YELLOW))
 
         # 2) Browser history (ask first unless overridden)
         run_browser_cleanup = False
         if not args.no_browser:
-            run_browser_cleanup = prompt_yes_no(
-                "Do you want to clear browser history (Chrome/Edge/Firefox)?",
-                default_no=True,
-                assume_yes=(True if args.yes else (False if args.no else None)),
-            )
+            run_browser_cleanup = decide("Do you want to clear browser history (Chrome/Edge/Firefox)?", default_no=True)
 
         if run_browser_cleanup:
             print(c("🧽 Clearing browser history...", _C.BLUE))
@@ -879,11 +1973,7 @@ def main(argv: list[str]) -> int:
             print(c("Skipped clearing browser history.", _C.DIM))
 
         # 3) Empty Recycle Bin
-        empty_bin = prompt_yes_no(
-            "Empty Recycle Bin for all drives?",
-            default_no=False,
-            assume_yes=(True if args.yes else (False if args.no else None)),
-        )
+        empty_bin = decide("Empty Recycle Bin for all drives?", default_no=False)
         if empty_bin:
             print(c("🗑️  Emptying Recycle Bin...", _C.BLUE))
             empty_recycle_bin(dry_run=args.dry_run, silent=True)
@@ -893,11 +1983,7 @@ def main(argv: list[str]) -> int:
         # 4) Update/Upgrade
         run_upgrades = False
         if not args.no_upgrade:
-            run_upgrades = prompt_yes_no(
-                "Run system package upgrades via winget/choco?",
-                default_no=False,
-                assume_yes=(True if args.yes else (False if args.no else None)),
-            )
+            run_upgrades = decide("Run system package upgrades via winget/choco?", default_no=False)
 
         if run_upgrades and not args.dry_run:
             do_update_upgrade()
@@ -908,19 +1994,14 @@ def main(argv: list[str]) -> int:
 
         # Final summary
         bytes_deleted = STATS.get("bytes_deleted", 0)
-        def _fmt_size(n: int) -> str:
-            for unit in ("B", "KB", "MB", "GB", "TB"):
-                if n < 1024 or unit == "TB":
-                    return f"{n:.2f} {unit}" if unit != "B" else f"{n} {unit}"
-                n = n / 1024.0
-            return f"{n:.2f} TB"
-
         summary_line = (
             f"Deleted files: {STATS['files_deleted']}, dirs: {STATS['dirs_deleted']}, "
             f"freed: {_fmt_size(bytes_deleted)}, "
             f"skipped(exclude): {STATS['skipped_by_exclude']}, skipped(age): {STATS['skipped_by_age']}, "
             f"failed: {STATS['locked_or_failed']}, scheduled(on reboot): {STATS['scheduled_on_reboot']}"
         )
+        if STATS["recycled"]:
+            summary_line += f", recycled: {STATS['recycled']}"
         print(c("✨ All done.", _C.GREEN, _C.BOLD))
         print(c(summary_line, _C.DIM))
 
@@ -929,7 +2010,7 @@ def main(argv: list[str]) -> int:
             try:
                 report_path = Path(args.json_report).resolve()
                 report = {
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": time.strftime(_TIMESTAMP_FORMAT),
                     "stats": STATS,
                     "options": {
                         "dry_run": CONFIG["dry_run"],
@@ -938,7 +2019,12 @@ def main(argv: list[str]) -> int:
                     },
                 }
                 report_path.parent.mkdir(parents=True, exist_ok=True)
-                report_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+                # Serialize straight into the file instead of building the text first
+                if _orjson is not None:
+                    report_path.write_bytes(_orjson.dumps(report, option=_orjson.OPT_INDENT_2))
+                else:
+                    with report_path.open("w", encoding="utf-8", buffering=1 << 16) as fp:
+                        json.dump(report, fp, indent=2)
                 _log(c(f"JSON report written to {report_path}", _C.DIM), level=1)
             except Exception:
                 print(c("Failed to write JSON report.", _C.YELLOW))